@@ -62,7 +62,7 @@ class GithubManager:
         for yaml_file in config_files:
             # Open yaml file as read
             with open(yaml_file, "r", encoding="utf-8") as config_file:
-                loaded_list = yaml.safe_load(config_file)
+                loaded_list = yaml.load(config_file, Loader=util.YamlSafeLoader)
                 self.parse_config_list(loaded_list)
                 self.config_data[yaml_file.stem] = loaded_list
 
@@ -10,6 +10,8 @@ import typer
 from pluginbase import PluginBase  # type: ignore[import]
 from dotenv import load_dotenv
 
+from sheetshuttle import sheet_collector
+
 PLUGIN_BASE = PluginBase("sheetshuttle.plugins")
 
 app = typer.Typer(name="sheetshuttle")
@@ -42,6 +44,22 @@ def init(
     print(f"{plugin_name} created successfully")
 
 
+@app.command(
+    "bundle", help="Merge the sheets configuration files into a single bundle."
+)
+def bundle(
+    sheets_config_directory: str = typer.Option(
+        "config/sheet_sources/",
+        "--sheets-config-directory",
+        "-sd",
+        help="Directory to get the sheets configuration .yaml files from",
+    ),
+):
+    """Write the bundle of the sheets configuration directory."""
+    bundle_path = sheet_collector.write_bundle(sheets_config_directory)
+    print(f"{bundle_path} created successfully")
+
+
 # pylint: disable=R0913
 @app.command("run", help="Run sheetshuttle using your custom plugin.")
 def sheetshuttle_run(
@@ -1,20 +1,49 @@
 """Set up object oriented structure for Google Sheet data retrieval."""
 
+# pylint: disable=C0302
+
+from __future__ import annotations
+
+import copy
+import functools
+import gzip
+import importlib.util
 import json
 import os
 import pathlib
 import pickle
-from typing import Dict, List
-
-import pandas as pd  # type: ignore[import]
-import yaml
-from google.oauth2 import service_account  # type: ignore[import]
-from googleapiclient.discovery import build  # type: ignore[import]
-from jsonschema import validate
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 
 from sheetshuttle import util
 
+# pandas, yaml, jsonschema and the Google API client take most of the import
+# time, they are imported where they are used so that commands that don't
+# need them start faster
+if TYPE_CHECKING:
+    import pandas as pd  # type: ignore[import]
+
+try:
+    import fastjsonschema  # type: ignore[import]
+except ImportError:
+    fastjsonschema = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import zstandard as zstd  # type: ignore[import]
+except ImportError:
+    zstd = None  # type: ignore[assignment]
+
 SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
+# number of sheet files collected concurrently by SheetCollector.collect_files
+MAX_COLLECT_WORKERS = 8
 CONFIG_SCHEMA = {
     "type": "object",
     "properties": {
@@ -91,6 +120,13 @@ CONFIG_SCHEMA = {
     },
 }
 
+# store string columns with pyarrow when it is installed
+STRING_DTYPE = "string[pyarrow]" if importlib.util.find_spec("pyarrow") else "string"
+
+# compile the schema once at import when fastjsonschema is available, the
+# generated validator is much faster than jsonschema.validate
+_VALIDATE_CONFIG = fastjsonschema.compile(CONFIG_SCHEMA) if fastjsonschema else None
+
 ENV_VAR_LIST = [
     "TYPE",
     "PROJECT_ID",
@@ -105,6 +141,134 @@ ENV_VAR_LIST = [
 ]
 
 
+# parsed yaml configurations keyed by path, stores (mtime_ns, size, config)
+_YAML_CACHE: "OrderedDict[str, Tuple[int, int, Dict]]" = OrderedDict()
+# maximum number of parsed configurations kept in _YAML_CACHE
+YAML_CACHE_SIZE = 100
+# seconds for which responses of the Sheets API are reused
+TTL_SECONDS = 30
+# maximum number of Sheets API responses kept in memory
+SHEETS_CACHE_SIZE = 256
+
+
+def _load_yaml_cached(path: pathlib.Path) -> Dict:
+    """Load a yaml file, reusing the parsed result if the file didn't change.
+
+    The file's modification time and size are used to validate the cached
+    entry. A deep copy is returned because callers may mutate the config.
+
+    Args:
+        path (pathlib.Path): path to the yaml file
+
+    Returns:
+        Dict: the parsed yaml configuration
+    """
+    key = str(path)
+    stat_result = path.stat()
+    cached = _YAML_CACHE.get(key)
+    if cached and cached[:2] == (stat_result.st_mtime_ns, stat_result.st_size):
+        _YAML_CACHE.move_to_end(key)
+        return copy.deepcopy(cached[2])
+    import yaml  # pylint: disable=C0415
+
+    # Open yaml file as read
+    with open(path, "r", encoding="utf-8") as config_file:
+        config_data = yaml.load(config_file, Loader=util.YamlSafeLoader)
+    _YAML_CACHE[key] = (stat_result.st_mtime_ns, stat_result.st_size, config_data)
+    _YAML_CACHE.move_to_end(key)
+    if len(_YAML_CACHE) > YAML_CACHE_SIZE:
+        _YAML_CACHE.popitem(last=False)
+    return copy.deepcopy(config_data)
+
+
+def get_bundle_path(sources_dir) -> pathlib.Path:
+    """Return the path of the bundle file for the sources_dir directory.
+
+    The bundle is stored next to the directory, for example the bundle of
+    config/sheet_sources is config/sheet_sources.bundle.yaml. The path is
+    resolved first so that directories like "." and "./" get a named bundle.
+    """
+    sources_path = pathlib.Path(sources_dir).resolve()
+    # the root directory has no name, its bundle is /.bundle.yaml
+    return sources_path.parent / f"{sources_path.name}.bundle.yaml"
+
+
+def write_bundle(sources_dir) -> pathlib.Path:
+    """Merge the yaml files of sources_dir into a single bundle file.
+
+    The bundle maps each file name, without extension, to its configuration.
+    SheetCollector reads it with one file access instead of one per file, as
+    long as the bundle is not older than the directory. The bundle should be
+    written again whenever a configuration file is edited.
+
+    Args:
+        sources_dir (str): path to the directory with the sheet sources
+
+    Raises:
+        Exception: thrown when no configuration files are found
+
+    Returns:
+        pathlib.Path: the path of the written bundle
+    """
+    import yaml  # pylint: disable=C0415
+
+    config_files: List[pathlib.Path] = util.get_yaml_files(sources_dir)
+    if not config_files:
+        raise Exception(f"ERROR: No configuration files found in {sources_dir}")
+    bundle = {
+        yaml_file.stem: _load_yaml_cached(yaml_file)
+        for yaml_file in sorted(config_files)
+    }
+    bundle_path = get_bundle_path(sources_dir)
+    with open(bundle_path, "w+", encoding="utf-8") as outfile:
+        yaml.safe_dump(bundle, outfile, sort_keys=False)
+    return bundle_path
+
+
+def _cache_epoch() -> int:
+    """Return the current time window of the Sheets API response cache.
+
+    Cached responses are keyed by the epoch, so they are no longer used once
+    TTL_SECONDS have passed and the epoch changes.
+    """
+    return int(time.time() // TTL_SECONDS)
+
+
+@functools.lru_cache(maxsize=SHEETS_CACHE_SIZE)
+def _cached_values_get(api, file_id: str, cell_range: str, epoch: int) -> Tuple:
+    # pylint: disable=W0613
+    """Request the values in cell_range, reusing responses within an epoch.
+
+    The values are returned as tuples so the cached response can't be mutated.
+    """
+    values = (
+        api.values()
+        .get(spreadsheetId=file_id, range=cell_range)
+        .execute()
+        .get("values", [])
+    )
+    return tuple(tuple(row) for row in values)
+
+
+@functools.lru_cache(maxsize=SHEETS_CACHE_SIZE)
+def _cached_values_batch_get(api, file_id: str, ranges: Tuple, epoch: int) -> Tuple:
+    # pylint: disable=W0613
+    """Request the values in all ranges at once, reusing responses within an epoch.
+
+    The values are returned as tuples so the cached response can't be mutated.
+    """
+    value_ranges = (
+        api.values()
+        .batchGet(spreadsheetId=file_id, ranges=list(ranges))
+        .execute()
+        .get("valueRanges", [])
+    )
+    return tuple(
+        tuple(tuple(row) for row in value_range.get("values", []))
+        for value_range in value_ranges
+    )
+
+
 class MissingAuthenticationVariable(Exception):
     """Raised when a Sheets authentication variable is missing."""
 
@@ -139,33 +303,151 @@ class SheetCollector:
         for sheet in self.sheets_data.values():
             sheet.print_sheet()
 
-    def collect_files(self) -> None:
+    def collect_files(self, lazy: bool = False) -> None:
         """
         Update sheets_data with Sheet objects from Google Sheets.
 
         Requires that the API was authenticated successfully.
 
+        Args:
+            lazy (bool, optional): delay the API calls of each sheet until
+                its region data is needed. Defaults to False.
+
         Raises:
             Exception: thrown when the Google Sheets API is not authenticated.
         """
         if not self.sheets:
             raise Exception("ERROR: Collector was not authenticated")
+        # parse all the yaml files first, this is cheap compared to the API
+        # calls needed to collect the regions
+        configs = self._load_configs()
+        # collect the regions of every file concurrently since the work is
+        # bound by network I/O, results are stored in the order of the files
+        with ThreadPoolExecutor(max_workers=MAX_COLLECT_WORKERS) as executor:
+            sheet_objects = executor.map(
+                functools.partial(self._build_sheet, lazy=lazy),
+                [config_data for _, config_data in configs],
+            )
+            for (stem, _), sheet_obj in zip(configs, sheet_objects):
+                # store the sheet object in sheet_data, use the yaml file name
+                # as key
+                self.sheets_data[stem] = sheet_obj
+
+    def dump_all(
+        self,
+        directory: pathlib.PosixPath,
+        formats=("json",),
+        max_workers: int = MAX_COLLECT_WORKERS,
+    ) -> None:
+        """Write every region of every sheet to files in directory.
+
+        The regions of each sheet are written to a subdirectory named after
+        its key in sheets_data so that sources with the same tab and region
+        names don't overwrite each other. The files are written concurrently
+        since the work is bound by disk I/O.
+
+        Args:
+            directory (pathlib.PosixPath): path to the directory where the files
+                be stored, created if it doesn't exist
+            formats (tuple, optional): formats to write each region in, any of
+                "json", "pickle" and "parquet", which requires pyarrow.
+                Defaults to ("json",).
+            max_workers (int, optional): maximum number of files written at
+                once. Defaults to MAX_COLLECT_WORKERS.
+
+        Raises:
+            Exception: thrown when one of the formats is not supported, its
+                optional dependency is not installed or two regions of the
+                same sheet would be written to the same file
+        """
+        for file_format in formats:
+            if not hasattr(Region, f"region_to_{file_format}"):
+                raise Exception(f"ERROR: unsupported region format {file_format}")
+            if file_format == "parquet" and not importlib.util.find_spec("pyarrow"):
+                raise Exception(
+                    "ERROR: the parquet format requires pyarrow, "
+                    "install sheetshuttle[parquet]"
+                )
+        sheet_regions = {
+            sheet_key: list(sheet.iter_regions())
+            for sheet_key, sheet in self.sheets_data.items()
+        }
+        for sheet_key, regions in sheet_regions.items():
+            full_names = [region.full_name for region in regions]
+            duplicates = sorted(
+                {name for name in full_names if full_names.count(name) > 1}
+            )
+            if duplicates:
+                raise Exception(
+                    f"ERROR: regions of {sheet_key} would overwrite the same files "
+                    f"{', '.join(duplicates)}"
+                )
+        tasks = []
+        for sheet_key, regions in sheet_regions.items():
+            sheet_directory = pathlib.Path(directory) / sheet_key
+            sheet_directory.mkdir(parents=True, exist_ok=True)
+            tasks.extend(
+                (region, file_format, sheet_directory)
+                for region in regions
+                for file_format in formats
+            )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # consume the results so that errors raised by a writer propagate
+            list(
+                executor.map(
+                    lambda task: getattr(task[0], f"region_to_{task[1]}")(task[2]),
+                    tasks,
+                )
+            )
+
+    def _load_configs(self) -> List[Tuple[str, Dict]]:
+        """Return (file name, configuration) pairs for every sheet source.
+
+        A bundle written by write_bundle is used instead of the individual
+        files when it is at least as new as the config_dir directory and every
+        yaml file in it, so files edited in place aren't hidden by the bundle.
+
+        Raises:
+            Exception: thrown when no configuration files are found
+
+        Returns:
+            List[Tuple[str, Dict]]: the yaml file names and their contents
+        """
         # get a list of all yaml and yml path objects in the config_dir
         config_files: List[pathlib.Path] = util.get_yaml_files(self.config_dir)
+        bundle_path = get_bundle_path(self.config_dir)
+        if bundle_path.is_file():
+            # editing a file in place doesn't change the mtime of the directory
+            source_mtimes = [yaml_file.stat().st_mtime_ns for yaml_file in config_files]
+            if self.config_dir.is_dir():
+                source_mtimes.append(self.config_dir.stat().st_mtime_ns)
+            if bundle_path.stat().st_mtime_ns >= max(source_mtimes, default=0):
+                return list(_load_yaml_cached(bundle_path).items())
         if not config_files:
             raise Exception(f"ERROR: No configuration files found in {self.config_dir}")
-        for yaml_file in config_files:
-            # Open yaml file as read
-            with open(yaml_file, "r", encoding="utf-8") as config_file:
-                config_data = yaml.safe_load(config_file)
-                # create sheet object using the yaml data
-                sheet_obj = Sheet(config_data, self.sheets)
-                # fill the sheet object with the regions
-                # by excecuting API calls
-                sheet_obj.collect_regions()
-                # store the sheet object in sheet_data, use the yaml file name
-                # as key
-                self.sheets_data[yaml_file.stem] = sheet_obj
+        return [
+            (yaml_file.stem, _load_yaml_cached(yaml_file)) for yaml_file in config_files
+        ]
+
+    def _build_sheet(self, config_data: Dict, lazy: bool = False) -> "Sheet":
+        """Create a Sheet object from config_data and collect its regions.
+
+        Runs in a worker thread of collect_files.
+
+        Args:
+            config_data (Dict): the parsed yaml configuration of the sheet
+            lazy (bool, optional): delay the API call until region data is
+                needed. Defaults to False.
+
+        Returns:
+            Sheet: the sheet object filled with the regions
+        """
+        # create sheet object using the yaml data
+        sheet_obj = Sheet(config_data, self.sheets)
+        # fill the sheet object with the regions
+        # by excecuting API calls
+        sheet_obj.collect_regions(lazy=lazy)
+        return sheet_obj
 
     @staticmethod
     def authenticate_api(key_file):
@@ -213,18 +495,60 @@ class SheetCollector:
                 f"Unclear source of Sheets authentication keys {key_file}."
                 + "Must be a .env or .json file"
             )
+        # pylint: disable=C0415
+        from google.oauth2 import service_account  # type: ignore[import]
+
         credentials = service_account.Credentials.from_service_account_info(
             creds_dict, scopes=SCOPES
         )
-        service = build("sheets", "v4", credentials=credentials)
+        service = SheetCollector.build_service(credentials)
         # pylint: disable=E1101
         sheets = service.spreadsheets()
         return credentials, service, sheets
 
+    @staticmethod
+    def build_service(credentials):
+        """Build a Sheets API service that can be shared between threads.
+
+        Args:
+            credentials: google-auth credentials used to authorize requests
+
+        Returns:
+            the Sheets API service object
+        """
+        # pylint: disable=C0415
+        import google_auth_httplib2  # type: ignore[import]
+        from googleapiclient.discovery import build  # type: ignore[import]
+        from googleapiclient.http import HttpRequest, build_http  # type: ignore[import]
+
+        thread_local = threading.local()
+
+        def build_request(_http, *args, **kwargs):
+            # httplib2 is not thread safe, so every thread sends its requests
+            # through its own authorized connection, build_http sets the same
+            # timeout and redirect handling as the default client
+            if not hasattr(thread_local, "http"):
+                thread_local.http = google_auth_httplib2.AuthorizedHttp(
+                    credentials, http=build_http()
+                )
+            return HttpRequest(thread_local.http, *args, **kwargs)
+
+        # the discovery document shipped with the client is used so that
+        # building the service doesn't require a request
+        return build(
+            "sheets",
+            "v4",
+            credentials=credentials,
+            requestBuilder=build_request,
+            static_discovery=True,
+        )
+
 
 class Sheet:
     """Retrieve Google Sheets data and store as Regions."""
 
+    _BANNER = "*" * 33
+
     def __init__(self, config: Dict, sheets_api) -> None:
         """Initialize a Sheet object.
 
@@ -236,51 +560,126 @@ class Sheet:
         self.api = sheets_api
         self.config: Dict = config
         Sheet.check_config_schema(self.config)
+        Sheet.add_region_ranges(self.config)
         self.tabs: Dict[str, Tab] = {}
+        self.table: Optional[pd.DataFrame] = None
+        # regions created by collect_regions whose data wasn't requested yet
+        self._pending_regions: List[Tuple[Region, Dict]] = []
+        # errors raised while converting the data of a fetched region, only
+        # raised again when that region is read
+        self._region_errors: Dict[Region, Exception] = {}
+        self._fetch_lock = threading.Lock()
+
+    def collect_regions(self, lazy: bool = False):
+        """Iterate through configuration and create a Region for each region.
 
-    def collect_regions(self):
-        """Iterate through configuration and request data through API."""
+        The data of all the regions is requested through a single batchGet
+        call. When lazy is True, the call is delayed until the data of one
+        of the regions is first accessed, all regions that weren't fetched
+        yet are then requested together.
+
+        Args:
+            lazy (bool, optional): delay the API call until region data is
+                needed. Defaults to False.
+        """
         # Extract ID if URL used as source_id
         if "/" in self.config["source_id"]:
             self.config["source_id"] = util.extract_sheet_id(self.config["source_id"])
         for sheet in self.config["sheets"]:
-            regions_dict = {}
+            if sheet["name"] not in self.tabs:
+                self.tabs[sheet["name"]] = Tab(sheet["name"], {})
+            regions_dict = self.tabs[sheet["name"]].regions
             for region in sheet["regions"]:
-                region_data = Sheet.execute_sheets_call(
-                    self.api,
-                    self.config["source_id"],
-                    sheet["name"],
-                    region["start"],
-                    region["end"],
-                )
-                if "fill" in region and region["fill"]:
-                    # Find region dimensions
-                    columns, rows = util.calculate_dimensions(
-                        region["start"], region["end"]
-                    )
-                    region_data = util.fill_to_dimensions(region_data, columns, rows)
-                # set the default type as string
-                types = "string"
-                if "types" in region:
-                    types = region["types"]
-                if region["contains_headers"]:
-                    data = Sheet.to_dataframe(region_data, types=types)
-                else:
-                    data = Sheet.to_dataframe(
-                        region_data,
-                        headers_in_data=False,
-                        headers=region["headers"],
-                        types=types,
-                    )
                 region_object = Region(
                     region["name"],
                     sheet["name"],
                     region["start"],
                     region["end"],
-                    data,
+                    loader=self._load_region,
                 )
+                self._pending_regions.append((region_object, region))
                 regions_dict[region_object.region_name] = region_object
-            self.tabs[sheet["name"]] = regions_dict
+        if not lazy:
+            self.fetch_regions()
+            for error_obj in self._region_errors.values():
+                raise error_obj
+
+    def fetch_regions(self):
+        """Request the data of every region that wasn't fetched yet.
+
+        Gathers every pending region range so that all of them are requested
+        through a single batchGet call instead of one call per region. Each
+        region is converted separately, a region whose data can't be
+        converted keeps its error without affecting the other regions.
+
+        Raises:
+            Exception: thrown when the API doesn't return data for every
+                requested range
+        """
+        with self._fetch_lock:
+            if not self._pending_regions:
+                return
+            ranges = [region["_range"] for _, region in self._pending_regions]
+            batch_data = Sheet.execute_batch_sheets_call(
+                self.api, self.config["source_id"], ranges
+            )
+            if len(batch_data) != len(ranges):
+                raise Exception(
+                    f"ERROR: requested {len(ranges)} ranges from "
+                    f"{self.config['source_id']} but received {len(batch_data)}"
+                )
+            for (region_object, region), region_data in zip(
+                self._pending_regions, batch_data
+            ):
+                try:
+                    region_object.data = Sheet.region_to_dataframe(region, region_data)
+                except Exception as error_obj:  # pylint: disable=W0703
+                    self._region_errors[region_object] = error_obj
+            self._pending_regions = []
+
+    def _load_region(self, region_object: Region) -> pd.DataFrame:
+        """Fetch the pending regions and return the data of region_object.
+
+        Raises:
+            Exception: thrown when the data of region_object couldn't be
+                fetched or converted
+        """
+        self.fetch_regions()
+        if region_object in self._region_errors:
+            raise self._region_errors[region_object]
+        # read _data directly, the data property would call the loader again
+        region_data = region_object._data  # pylint: disable=W0212
+        if region_data is None:
+            raise Exception(f"ERROR: no data was fetched for {region_object.full_name}")
+        return region_data
+
+    @staticmethod
+    def region_to_dataframe(region: Dict, region_data: List[List]) -> pd.DataFrame:
+        """Convert the data retrieved for a region using its configuration.
+
+        Args:
+            region (Dict): the configuration of the region
+            region_data (List[List]): Retrieved data from Sheets API
+
+        Returns:
+            pd.DataFrame: The pandas dataframe of the region
+        """
+        if "fill" in region and region["fill"]:
+            # Find region dimensions
+            columns, rows = util.calculate_dimensions(region["start"], region["end"])
+            region_data = util.fill_to_dimensions(region_data, columns, rows)
+        # set the default type as string
+        types = "string"
+        if "types" in region:
+            types = region["types"]
+        if region["contains_headers"]:
+            return Sheet.to_dataframe(region_data, types=types)
+        return Sheet.to_dataframe(
+            region_data,
+            headers_in_data=False,
+            headers=region["headers"],
+            types=types,
+        )
 
     def get_tab(self, tab_name: str):
         """Return a Tab object from the tabs dictionary.
@@ -294,12 +693,63 @@ class Sheet:
         requested_tab: Tab = self.tabs[tab_name]
         return requested_tab
 
+    def materialize_table(self) -> pd.DataFrame:
+        """Stack the data of every region into a single dataframe.
+
+        Rows keep the columns of their own region and are labelled by the
+        name of their tab and region in categorical _tab and _region
+        columns, which allows vectorized operations like
+        groupby(["_tab", "_region"]) over all the regions at once.
+        The result is also stored in self.table.
+
+        Returns:
+            pd.DataFrame: the data of all regions in one dataframe
+        """
+        import pandas as pd  # pylint: disable=C0415
+
+        labelled_regions = [
+            (tab_name, region)
+            for tab_name, tab_obj in self.tabs.items()
+            for region in tab_obj.regions.values()
+        ]
+        # region names repeat across tabs, so each label keeps unique values
+        tab_dtype = pd.CategoricalDtype(list(self.tabs))
+        region_dtype = pd.CategoricalDtype(
+            list(dict.fromkeys(region.region_name for _, region in labelled_regions))
+        )
+        if not labelled_regions:
+            self.table = pd.DataFrame(
+                {
+                    "_tab": pd.Categorical([], dtype=tab_dtype),
+                    "_region": pd.Categorical([], dtype=region_dtype),
+                }
+            )
+            return self.table
+        self.table = pd.concat(
+            [
+                region.data.assign(
+                    _tab=pd.Categorical([tab_name] * len(region.data), dtype=tab_dtype),
+                    _region=pd.Categorical(
+                        [region.region_name] * len(region.data), dtype=region_dtype
+                    ),
+                )
+                for tab_name, region in labelled_regions
+            ],
+            ignore_index=True,
+        )
+        return self.table
+
+    def iter_regions(self):
+        """Yield every Region object stored in self.tabs."""
+        for tab_obj in self.tabs.values():
+            yield from tab_obj.regions.values()
+
     def print_sheet(self):
         """Iterate through self.regions and print the contents."""
-        for tab_name, tab_obj in self.tabs.items():
-            print(f"******\t {tab_name} \t ******")
+        for tab_obj in self.tabs.values():
+            print(f"******\t {tab_obj.name} \t ******")
             tab_obj.print_tab()
-            print("*********************************")
+            print(self._BANNER)
 
     @staticmethod
     def to_dataframe(
@@ -335,13 +785,86 @@ class Sheet:
                 raise Exception(
                     "ERROR: data must contain at least two rows if headers are in data."
                 )
-            result_data = pd.DataFrame(data[1:], columns=data[0]).astype(types)
-            return result_data
+            return Sheet.columns_to_dataframe(data[1:], data[0]).astype(
+                Sheet.resolve_types(types)
+            )
         if not headers:
             raise Exception("No passed table headers")
-        result_data = pd.DataFrame(data, columns=headers).astype(types)
+        return Sheet.columns_to_dataframe(data, headers).astype(
+            Sheet.resolve_types(types)
+        )
+
+    @staticmethod
+    def resolve_types(types):
+        """Replace the string type with the pyarrow backed string dtype.
+
+        Pyarrow strings are stored in contiguous buffers instead of one Python
+        object per cell. The default string dtype is kept when pyarrow is not
+        installed.
+
+        Args:
+            types (string or dict): one pandas datatype for the whole dataframe
+                or a dictionary with column labels and their data types.
+
+        Returns:
+            string or dict: the types with string replaced by STRING_DTYPE
+        """
+        if isinstance(types, dict):
+            return {
+                column: STRING_DTYPE if column_type == "string" else column_type
+                for column, column_type in types.items()
+            }
+        return STRING_DTYPE if types == "string" else types
+
+    @staticmethod
+    def columns_to_dataframe(rows: List[List], headers: List) -> pd.DataFrame:
+        """Build a dataframe column by column from a list of rows.
+
+        The Sheets API drops trailing empty cells, so short rows are padded
+        with None before they are transposed into columns.
+
+        Args:
+            rows (List[List]): the rows of the table, without the headers
+            headers (List): the column labels
+
+        Raises:
+            Exception: thrown when a row has more values than headers
+
+        Returns:
+            pd.DataFrame: the dataframe with one column per header
+        """
+        import pandas as pd  # pylint: disable=C0415
+
+        width = len(headers)
+        if any(len(row) > width for row in rows):
+            raise Exception(
+                f"ERROR: data has more columns than the {width} passed headers"
+            )
+        padded_rows = [list(row) + [None] * (width - len(row)) for row in rows]
+        columns = list(zip(*padded_rows)) if padded_rows else [()] * width
+        # key the columns by position so that duplicate headers are kept
+        result_data = pd.DataFrame(
+            {index: list(column) for index, column in enumerate(columns)},
+            copy=False,
+        )
+        result_data.columns = list(headers)
         return result_data
 
+    @staticmethod
+    def add_region_ranges(config: Dict):
+        """Store the A1 notation range of every region in its configuration.
+
+        The range is kept under the _range key of the region (eg. sheet1!A4:H5)
+        so that it is only built once per region.
+
+        Args:
+            config (Dict): a validated sheet configuration
+        """
+        for sheet in config["sheets"]:
+            range_prefix = f"{sheet['name']}!"
+            for region in sheet["regions"]:
+                region["_range"] = f"{range_prefix}{region['start']}:{region['end']}"
+
     @staticmethod
     def check_config_schema(config: Dict):
         """Validate the yaml configuration against a preset schema.add().
@@ -353,7 +876,20 @@ class Sheet:
             ValidationError: The schema doesn't validate agains the preset
             json schema
         """
-        validate(instance=config, schema=CONFIG_SCHEMA)
+        # jsonschema is only imported when it is needed, a passing config
+        # validated by fastjsonschema never loads it
+        # pylint: disable=C0415
+        if not _VALIDATE_CONFIG:
+            from jsonschema import validate
+
+            validate(instance=config, schema=CONFIG_SCHEMA)
+            return
+        try:
+            _VALIDATE_CONFIG(config)
+        except fastjsonschema.JsonSchemaException as error_obj:
+            from jsonschema import ValidationError
+
+            raise ValidationError(str(error_obj)) from error_obj
 
     @staticmethod
     def execute_sheets_call(
@@ -370,15 +906,30 @@ class Sheet:
         Returns:
             list[list]: the data in the specified range.
         """
-        return (
-            api.values()
-            .get(
-                spreadsheetId=file_id,
-                range=f"{sheet_name}!{start_range}:{end_range}",
-            )
-            .execute()
-            .get("values", [])
+        values = _cached_values_get(
+            api,
+            file_id,
+            f"{sheet_name}!{start_range}:{end_range}",
+            _cache_epoch(),
+        )
+        return [list(row) for row in values]
+
+    @staticmethod
+    def execute_batch_sheets_call(api, file_id: str, ranges: List[str]) -> List[List]:
+        """Execute a single API call to get the data in several ranges.
+
+        Args:
+            file_id (str): ID of the Google Sheet file
+            ranges (List[str]): ranges in A1 notation including the sheet
+                name (eg. sheet1!A4:H5)
+
+        Returns:
+            List[List]: the data in each range, in the same order as ranges.
+        """
+        batch_values = _cached_values_batch_get(
+            api, file_id, tuple(ranges), _cache_epoch()
         )
+        return [[list(row) for row in values] for values in batch_values]
 
 
 class Region:
@@ -391,7 +942,8 @@ class Region:
         parent_sheet_name: str,
         start_range: str,
         end_range: str,
-        data: pd.DataFrame,
+        data: Optional[pd.DataFrame] = None,
+        loader: Optional[Callable[[Region], pd.DataFrame]] = None,
     ) -> None:
         """Create a Region object.
 
@@ -400,14 +952,43 @@ class Region:
             parent_sheet_name (str): name of the sheet the region belongs to
             start_range (str): Cell name to start from (eg. A4)
             end_range (str): Cell name to end at (eg. H5)
-            data (pd.DataFrame): Data in the region
+            data (pd.DataFrame, optional): Data in the region
+            loader (Callable, optional): called with the region to get its
+                data the first time it is accessed when data is not passed
         """
         self.region_name = region_name
         self.parent_sheet_name = parent_sheet_name
         self.full_name = f"{parent_sheet_name}_{region_name}"
         self.start_range = start_range
         self.end_range = end_range
-        self.data: pd.DataFrame = data
+        self._data: Optional[pd.DataFrame] = data
+        self._loader = loader
+
+    @property
+    def data(self) -> pd.DataFrame:
+        """Return the data in the region, loading it on first access."""
+        if self._data is None and self._loader:
+            self._data = self._loader(self)
+        return self._data
+
+    @data.setter
+    def data(self, data: pd.DataFrame):
+        """Set the data in the region."""
+        self._data = data
+
+    def __getstate__(self) -> Dict:
+        """Load the data and drop the loader so that the region can be pickled."""
+        state = self.__dict__.copy()
+        state["_data"] = self.data
+        state["_loader"] = None
+        return state
+
+    def __setstate__(self, state: Dict):
+        """Restore a pickled region, including ones pickled before lazy loading."""
+        if "data" in state:
+            state["_data"] = state.pop("data")
+        state.setdefault("_loader", None)
+        self.__dict__.update(state)
 
     def print_region(self):
         """Print the contents of the region in a markdown table format."""
@@ -416,16 +997,51 @@ class Region:
         print(self.data.to_markdown())
 
     def region_to_pickle(self, directory: pathlib.PosixPath):
-        """Write the region object to a Pickle file.
+        """Write the region object to a compressed Pickle file.
+
+        The file is compressed with zstandard when it is installed
+        ({full_name}.pkl.zst) and with gzip otherwise ({full_name}.pkl.gz).
 
         Args:
             directory (pathlib.PosixPath): path to the directory where the file
                 be stored
         """
-        with open(
-            pathlib.Path(".") / directory / f"{self.full_name}.pkl", "wb"
-        ) as outfile:
-            pickle.dump(self, outfile)
+        file_path = pathlib.Path(".") / directory / f"{self.full_name}.pkl"
+        if zstd:
+            with open(file_path.with_suffix(".pkl.zst"), "wb") as raw_file:
+                with zstd.ZstdCompressor(level=3).stream_writer(raw_file) as outfile:
+                    pickle.dump(self, outfile, protocol=pickle.HIGHEST_PROTOCOL)
+        else:
+            with gzip.open(
+                file_path.with_suffix(".pkl.gz"), "wb", compresslevel=1
+            ) as outfile:
+                pickle.dump(self, outfile, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def from_pickle(cls, path: pathlib.Path):
+        """Load a Region object from a file written by region_to_pickle.
+
+        Args:
+            path (pathlib.Path): path to the .pkl.zst, .pkl.gz or .pkl file
+
+        Raises:
+            Exception: thrown when a .pkl.zst file is read without zstandard
+
+        Returns:
+            Region: the region object stored in the file
+        """
+        path = pathlib.Path(path)
+        if path.suffix == ".zst":
+            if not zstd:
+                raise Exception(f"ERROR: zstandard is required to read {path}")
+            with open(path, "rb") as raw_file:
+                with zstd.ZstdDecompressor().stream_reader(raw_file) as input_file:
+                    return pickle.load(input_file)
+        if path.suffix == ".gz":
+            with gzip.open(path, "rb") as input_file:
+                return pickle.load(input_file)
+        with open(path, "rb") as input_file:
+            return pickle.load(input_file)
 
     def region_to_json(self, directory: pathlib.PosixPath):
         """Write the region object to a JSON file.
@@ -440,19 +1056,92 @@ class Region:
             "full_name": self.full_name,
             "start_range": self.start_range,
             "end_range": self.end_range,
-            "data": self.data.to_dict("index"),
+            "data": self.data.to_dict(orient="records"),
         }
+        file_path = pathlib.Path(".") / directory / f"{self.full_name}.json"
+        if orjson:
+            # column labels are not always strings, convert them like json does
+            # pylint: disable=E1101
+            options = (
+                orjson.OPT_INDENT_2
+                | orjson.OPT_SERIALIZE_NUMPY
+                | orjson.OPT_NON_STR_KEYS
+            )
+            with open(file_path, "wb") as binary_outfile:
+                binary_outfile.write(orjson.dumps(self_data, option=options))
+        else:
+            with open(file_path, "w+", encoding="utf-8") as outfile:
+                json.dump(self_data, outfile)
+
+    def region_to_parquet(self, directory: pathlib.PosixPath):
+        """Write the region data to a Parquet file and its metadata to JSON.
+
+        The metadata is stored in a {full_name}.meta.json file next to the
+        {full_name}.parquet file so that it can be restored with from_parquet.
+
+        Args:
+            directory (pathlib.PosixPath): path to the directory where the files
+                be stored
+        """
+        directory_path = pathlib.Path(".") / directory
+        # Parquet only supports string column labels
+        self.data.rename(columns=str).to_parquet(
+            directory_path / f"{self.full_name}.parquet",
+            engine="pyarrow",
+            compression="zstd",
+            index=False,
+        )
         with open(
-            pathlib.Path(".") / directory / f"{self.full_name}.json",
+            directory_path / f"{self.full_name}.meta.json",
             "w+",
             encoding="utf-8",
         ) as outfile:
-            json.dump(self_data, outfile, indent=4)
+            json.dump(self.metadata(), outfile, indent=4)
+
+    def metadata(self) -> Dict[str, str]:
+        """Return the metadata needed to recreate the region without its data."""
+        return {
+            "region_name": self.region_name,
+            "parent_sheet_name": self.parent_sheet_name,
+            "start_range": self.start_range,
+            "end_range": self.end_range,
+        }
+
+    @classmethod
+    def from_parquet(cls, path: pathlib.Path, meta: Optional[Dict] = None):
+        """Create a Region object from a file written by region_to_parquet.
+
+        Args:
+            path (pathlib.Path): path to the .parquet file
+            meta (Dict, optional): the region metadata. Defaults to reading
+                the .meta.json file stored next to the .parquet file.
+
+        Returns:
+            Region: the region object with the data from the file
+        """
+        path = pathlib.Path(path)
+        if meta is None:
+            with open(
+                path.with_suffix(".meta.json"), "r", encoding="utf-8"
+            ) as input_file:
+                meta = json.load(input_file)
+        import pandas as pd  # pylint: disable=C0415
+
+        data = pd.read_parquet(path, engine="pyarrow")
+        return cls(
+            meta["region_name"],
+            meta["parent_sheet_name"],
+            meta["start_range"],
+            meta["end_range"],
+            data,
+        )
 
 
 class Tab:
     """Store data frame and metadata about Google Sheet tabs."""
 
+    _BANNER = "#" * 42
+
     def __init__(self, name: str, regions: Dict[str, Region]) -> None:
         """Initialize Tab."""
         self.name = name
@@ -461,10 +1150,14 @@ class Tab:
     def print_tab(self):
         """Print Tab."""
         print(f"\t- Tab name: {self.name}")
-        for region_name, region_obj in self.regions.items():
-            print(f"###############  {region_name} ###############")
+        for region_obj in self.regions.values():
+            print(f"###############  {region_obj.region_name} ###############")
             region_obj.print_region()
-            print("##########################################")
+            print(self._BANNER)
+
+    def __contains__(self, region_name: str) -> bool:
+        """Check if a region named region_name is in the tab."""
+        return region_name in self.regions
 
     def get_region(self, region_name: str):
         """Return a region object from the regions dictionary.
@@ -4,8 +4,12 @@ import os
 import pathlib
 from typing import List, Tuple, Any
 
-from openpyxl.utils.cell import coordinate_from_string, column_index_from_string
-
+# Prefer the libyaml based loader, it is much faster than the pure Python one
+# pylint: disable=W0611
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader  # type: ignore[misc] # noqa: F401
 
 GH_ENV_VAR_NAME = "GH_ACCESS_TOKEN"
 
@@ -15,10 +19,21 @@ class InvalidSheetInfo(Exception):
 
 
 def get_yaml_files(path_obj):
-    """Get a list of .yaml and .yml files in the path."""
-    extensions = ["*.yaml", "*.yml"]
-    config_files: List[pathlib.Path] = list(path_obj.glob(extensions[0]))
-    config_files.extend(list(path_obj.glob(extensions[1])))
+    """Get a list of .yaml and .yml files in the path, sorted by file name."""
+    extensions = (".yaml", ".yml")
+    directory = pathlib.Path(path_obj)
+    # a missing directory has no configuration files
+    if not directory.is_dir():
+        return []
+    # scan the directory once and check the suffix directly instead of
+    # matching every entry against a glob pattern for each extension
+    with os.scandir(directory) as entries:
+        file_names = sorted(
+            entry.name
+            for entry in entries
+            if entry.name.endswith(extensions) and entry.is_file()
+        )
+    config_files: List[pathlib.Path] = [directory / name for name in file_names]
     return config_files
 
 
@@ -57,6 +72,10 @@ def calculate_dimensions(start_range: str, end_range: str) -> Tuple[int, int]:
         Tuple[int, int]: dimensions of the region. (number of columns,
         number df rows )
     """
+    # openpyxl is slow to import, so it is only imported when needed
+    # pylint: disable=C0415
+    from openpyxl.utils.cell import coordinate_from_string, column_index_from_string
+
     # Split the range into letter, number Tuple
     start_data = coordinate_from_string(start_range)
     end_data = coordinate_from_string(end_range)
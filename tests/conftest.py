@@ -6,6 +6,8 @@ import pytest
 
 from dotenv import load_dotenv
 
+from sheetshuttle import sheet_collector
+
 # pylint: disable=C0103,W0602
 full_test_data = {}
 
@@ -34,3 +36,13 @@ def pytest_sessionstart():
 def test_data():
     """Return full_test_data."""
     return full_test_data
+
+
+@pytest.fixture
+def mock_authentication(monkeypatch):
+    """Skip Google authentication when a SheetCollector is created."""
+    monkeypatch.setattr(
+        sheet_collector.SheetCollector,
+        "authenticate_api",
+        staticmethod(lambda key_file: (None, None, None)),
+    )
@@ -1,8 +1,13 @@
 """Test the main module of SheetShuttle"""
+
 import pytest
+import yaml
+from typer.testing import CliRunner
 
 from sheetshuttle import main
 
+runner = CliRunner()
+
 
 @pytest.mark.parametrize(
     "directory,name,errors",
@@ -23,3 +28,16 @@ def test_load_plugin(directory, name, errors):
             main.load_plugin(directory, name)
     else:
         main.load_plugin(directory, name)
+
+
+def test_bundle_command_writes_bundle(tmp_path):
+    """Check that the bundle command writes the bundle and prints its path."""
+    sources_dir = tmp_path / "sheet_sources"
+    sources_dir.mkdir()
+    (sources_dir / "grades.yaml").write_text("source_id: abc\n", encoding="utf-8")
+    result = runner.invoke(main.app, ["bundle", "-sd", str(sources_dir)])
+    bundle_path = tmp_path / "sheet_sources.bundle.yaml"
+    assert result.exit_code == 0
+    assert f"{bundle_path} created successfully" in result.stdout
+    with open(bundle_path, encoding="utf-8") as bundle_file:
+        assert yaml.safe_load(bundle_file) == {"grades": {"source_id": "abc"}}
@@ -1,9 +1,12 @@
 """Test cases for sheet_collector Module."""
 
+import copy
 import json
 import os
 import pathlib
-import pickle
+import threading
+import google.auth.credentials
+import jsonschema
 import pytest
 import yaml
 
@@ -53,10 +56,10 @@ def test_region_to_json(tmpdir):
         out_data = json.load(input_file)
     assert not len(out_data) == 0
     assert out_data == {
-        "data": {
-            "0": {"0": "name", "1": "class", "2": "grade"},
-            "1": {"0": "Noor", "1": "2022", "2": "94"},
-        },
+        "data": [
+            {"0": "name", "1": "class", "2": "grade"},
+            {"0": "Noor", "1": "2022", "2": "94"},
+        ],
         "end_range": "Z20",
         "full_name": "CMPCS101_lab1",
         "parent_name": "CMPCS101",
@@ -65,6 +68,24 @@ def test_region_to_json(tmpdir):
     }
 
 
+def test_region_to_json_without_orjson(tmpdir, monkeypatch):
+    """Check that regions are stored as json when orjson is not installed."""
+    monkeypatch.setattr(sheet_collector, "orjson", None)
+    tempdir = tmpdir.mkdir("temp")
+    temp_path = str(tempdir)
+    my_dataframe = pd.DataFrame([["name", "class", "grade"], ["Noor", "2022", "94"]])
+    my_region = sheet_collector.Region("lab1", "CMPCS101", "A1", "Z20", my_dataframe)
+    my_region.region_to_json(temp_path)
+    with open(
+        pathlib.Path(".") / temp_path / "CMPCS101_lab1.json", "r", encoding="utf-8"
+    ) as input_file:
+        out_data = json.load(input_file)
+    assert out_data["data"] == [
+        {"0": "name", "1": "class", "2": "grade"},
+        {"0": "Noor", "1": "2022", "2": "94"},
+    ]
+
+
 def test_region_to_pickle(tmpdir):
     """Use temporary directory to test regions storage as pickle file."""
     tempdir = tmpdir.mkdir("temp")
@@ -72,8 +93,10 @@ def test_region_to_pickle(tmpdir):
     my_dataframe = pd.DataFrame([["name", "class", "grade"], ["Noor", "2022", "94"]])
     my_region = sheet_collector.Region("lab1", "CMPCS101", "A1", "Z20", my_dataframe)
     my_region.region_to_pickle(temp_path)
-    with open(pathlib.Path(".") / temp_path / "CMPCS101_lab1.pkl", "rb") as input_file:
-        out_data = pickle.load(input_file)
+    extension = "pkl.zst" if sheet_collector.zstd else "pkl.gz"
+    out_data = sheet_collector.Region.from_pickle(
+        pathlib.Path(".") / temp_path / f"CMPCS101_lab1.{extension}"
+    )
     assert out_data.region_name == my_region.region_name
     assert out_data.parent_sheet_name == my_region.parent_sheet_name
     assert out_data.full_name == my_region.full_name
@@ -82,6 +105,27 @@ def test_region_to_pickle(tmpdir):
     assert isinstance(out_data.data, pd.DataFrame)
 
 
+def test_region_to_parquet(tmpdir):
+    """Use temporary directory to test regions storage as parquet file."""
+    pytest.importorskip("pyarrow")
+    tempdir = tmpdir.mkdir("temp")
+    temp_path = str(tempdir)
+    my_dataframe = pd.DataFrame(
+        [["Noor", "2022", "94"]], columns=["name", "class", "grade"]
+    )
+    my_region = sheet_collector.Region("lab1", "CMPCS101", "A1", "Z20", my_dataframe)
+    my_region.region_to_parquet(temp_path)
+    out_data = sheet_collector.Region.from_parquet(
+        pathlib.Path(".") / temp_path / "CMPCS101_lab1.parquet"
+    )
+    assert out_data.region_name == my_region.region_name
+    assert out_data.parent_sheet_name == my_region.parent_sheet_name
+    assert out_data.full_name == my_region.full_name
+    assert out_data.start_range == my_region.start_range
+    assert out_data.end_range == my_region.end_range
+    assert out_data.data.equals(my_dataframe)
+
+
 def test_sheet_check_config_schema_no_error(test_data):
     """Use the test_data fixture to check json schema validation."""
     passing_data = test_data["sheets_schema_test"]["passing"]
@@ -94,11 +138,21 @@ def test_sheet_check_config_schema_throws_error(test_data):
     """Use the test_data fixture to check json schema validation."""
     failing_data = test_data["sheets_schema_test"]["failing"]
     for config in failing_data:
-        with pytest.raises(Exception):
+        with pytest.raises(jsonschema.ValidationError):
             sheet_collector.Sheet.check_config_schema(config)
     assert True
 
 
+def test_sheet_check_config_schema_without_fastjsonschema(test_data, monkeypatch):
+    """Check that jsonschema is used when fastjsonschema is not installed."""
+    monkeypatch.setattr(sheet_collector, "_VALIDATE_CONFIG", None)
+    for config in test_data["sheets_schema_test"]["passing"]:
+        sheet_collector.Sheet.check_config_schema(config)
+    for config in test_data["sheets_schema_test"]["failing"]:
+        with pytest.raises(jsonschema.ValidationError):
+            sheet_collector.Sheet.check_config_schema(config)
+
+
 def test_sheet_initialize_empty_config():
     """Check that initializing a sheet with empty config throws error."""
     sample_config = {}
@@ -186,6 +240,51 @@ end range: H20
     assert second_item in captured.out
 
 
+def test_sheet_materialize_table(test_data):
+    """Check that the regions of a sheet are stacked into one dataframe."""
+    sample_config = test_data["sheets_schema_test"]["passing"][0]
+    my_sheet = sheet_collector.Sheet(sample_config, None)
+    first_data = pd.DataFrame({"name": ["Noor", "Tommy"], "grade": ["94", "96"]})
+    second_data = pd.DataFrame({"name": ["Noor"], "lab1": ["100"]})
+    first_region = sheet_collector.Region("overall", "sheet1", "A1", "B3", first_data)
+    second_region = sheet_collector.Region("labs", "sheet2", "A1", "B2", second_data)
+    my_sheet.tabs = {
+        "sheet1": sheet_collector.Tab("sheet1", {"overall": first_region}),
+        "sheet2": sheet_collector.Tab("sheet2", {"labs": second_region}),
+    }
+    table = my_sheet.materialize_table()
+    assert my_sheet.table is table
+    assert len(table) == 3
+    assert list(table["_tab"].cat.categories) == ["sheet1", "sheet2"]
+    assert list(table["_region"].cat.categories) == ["overall", "labs"]
+    assert list(table.groupby("_region").size()) == [2, 1]
+
+
+def test_sheet_materialize_table_no_regions(test_data):
+    """Check that a sheet without regions gives an empty table."""
+    sample_config = test_data["sheets_schema_test"]["passing"][0]
+    my_sheet = sheet_collector.Sheet(sample_config, None)
+    table = my_sheet.materialize_table()
+    assert table.empty
+    assert list(table.columns) == ["_tab", "_region"]
+
+
+def test_sheet_materialize_table_colliding_full_names(test_data):
+    """Check that regions with the same full_name are labelled separately."""
+    sample_config = test_data["sheets_schema_test"]["passing"][0]
+    my_sheet = sheet_collector.Sheet(sample_config, None)
+    my_dataframe = pd.DataFrame({"name": ["Noor"]})
+    first_region = sheet_collector.Region("b_c", "a", "A1", "A2", my_dataframe)
+    second_region = sheet_collector.Region("c", "a_b", "A1", "A2", my_dataframe)
+    assert first_region.full_name == second_region.full_name
+    my_sheet.tabs = {
+        "a": sheet_collector.Tab("a", {"b_c": first_region}),
+        "a_b": sheet_collector.Tab("a_b", {"c": second_region}),
+    }
+    table = my_sheet.materialize_table()
+    assert len(table.groupby(["_tab", "_region"], observed=True)) == 2
+
+
 def test_sheet_to_dataframe_no_error_with_headers():
     """Check that conversion to data frame using preset headers is done correctly."""
     data = [["name", "class", "age"], ["Noor", 2022, 21], ["Thomas", "2023", 21]]
@@ -202,6 +301,26 @@ def test_sheet_to_dataframe_no_error_no_headers():
     assert list(my_dataframe["name"]) == ["Noor", "Thomas"]
 
 
+def test_sheet_to_dataframe_pads_short_rows():
+    """Check that rows missing trailing cells are padded with empty values."""
+    data = [["name", "class", "age"], ["Noor", "2022"], ["Thomas", "2023", "21"]]
+    my_dataframe = sheet_collector.Sheet.to_dataframe(
+        data, headers_in_data=True, types="object"
+    )
+    assert list(my_dataframe.columns) == ["name", "class", "age"]
+    assert list(my_dataframe["age"]) == [None, "21"]
+
+
+def test_sheet_to_dataframe_uses_string_dtype():
+    """Check that string columns use STRING_DTYPE and other types are kept."""
+    data = [["name", "age"], ["Noor", "21"], ["Thomas", "22"]]
+    my_dataframe = sheet_collector.Sheet.to_dataframe(
+        data, types={"name": "string", "age": "int"}
+    )
+    assert my_dataframe["name"].dtype == sheet_collector.STRING_DTYPE
+    assert my_dataframe["age"].dtype == "int"
+
+
 def test_sheet_to_dataframe_throws_error():
     """Check that an error is thrown by to_dataframe when using headers.
 
@@ -229,6 +348,153 @@ def test_sheet_to_dataframe_one_row_input():
     assert True
 
 
+class FakeSheetsApi:
+    """Stand in for the spreadsheets() resource of the Sheets API."""
+
+    def __init__(self, value_ranges):
+        """Store the value ranges to return and record requests."""
+        self.value_ranges = value_ranges
+        self.requests = []
+
+    def values(self):
+        """Return self to mimic the values() resource."""
+        return self
+
+    def batchGet(self, spreadsheetId, ranges):  # pylint: disable=C0103
+        """Record the requested ranges."""
+        self.requests.append((spreadsheetId, ranges))
+        return self
+
+    def execute(self):
+        """Return the stored value ranges."""
+        return {"valueRanges": self.value_ranges}
+
+
+def test_sheet_execute_batch_sheets_call_returns_values():
+    """Check that batch call returns the values of every range in order."""
+    api = FakeSheetsApi([{"values": [["a", "b"]]}, {}])
+    data = sheet_collector.Sheet.execute_batch_sheets_call(
+        api, "file_id", ["sheet1!A1:B1", "sheet1!C1:D1"]
+    )
+    assert data == [[["a", "b"]], []]
+    assert api.requests == [("file_id", ["sheet1!A1:B1", "sheet1!C1:D1"])]
+
+
+def test_sheet_execute_batch_sheets_call_reuses_response(monkeypatch):
+    """Check that repeated batch calls are answered from the cache until it expires."""
+    api = FakeSheetsApi([{"values": [["a", "b"]]}])
+    current_epoch = [1000]
+    monkeypatch.setattr(sheet_collector, "_cache_epoch", lambda: current_epoch[0])
+    first_data = sheet_collector.Sheet.execute_batch_sheets_call(
+        api, "file_id", ["sheet1!A1:B1"]
+    )
+    # mutating the returned data must not change the cached response
+    first_data[0][0].append("c")
+    second_data = sheet_collector.Sheet.execute_batch_sheets_call(
+        api, "file_id", ["sheet1!A1:B1"]
+    )
+    assert second_data == [[["a", "b"]]]
+    assert len(api.requests) == 1
+    current_epoch[0] += 1
+    sheet_collector.Sheet.execute_batch_sheets_call(api, "file_id", ["sheet1!A1:B1"])
+    assert len(api.requests) == 2
+
+
+def test_sheet_collect_regions_single_batch_call(test_data):
+    """Check that all regions are collected using one batch API call."""
+    sample_config = test_data["collect_regions_test"]["sample_config"]
+    region_count = sum(len(sheet["regions"]) for sheet in sample_config["sheets"])
+    region_values = [["First", "Last", "Grade"], ["Noor", "Buchi", "94"]]
+    api = FakeSheetsApi([{"values": region_values}] * region_count)
+    my_sheet = sheet_collector.Sheet(sample_config, api)
+    my_sheet.collect_regions()
+    assert len(api.requests) == 1
+    assert api.requests[0][1] == [
+        f"{sheet['name']}!{region['start']}:{region['end']}"
+        for sheet in sample_config["sheets"]
+        for region in sheet["regions"]
+    ]
+    for sheet in sample_config["sheets"]:
+        assert my_sheet.get_tab(sheet["name"]).name == sheet["name"]
+        for region in sheet["regions"]:
+            assert region["name"] in my_sheet.tabs[sheet["name"]]
+    # collected tabs can be printed
+    my_sheet.print_sheet()
+
+
+def test_sheet_collect_regions_lazy(test_data, tmpdir):
+    """Check that lazy regions are fetched together on first data access."""
+    sample_config = test_data["collect_regions_test"]["sample_config"]
+    region_count = sum(len(sheet["regions"]) for sheet in sample_config["sheets"])
+    region_values = [["First", "Last", "Grade"], ["Noor", "Buchi", "94"]]
+    api = FakeSheetsApi([{"values": region_values}] * region_count)
+    my_sheet = sheet_collector.Sheet(sample_config, api)
+    my_sheet.collect_regions(lazy=True)
+    assert not api.requests
+    roster = my_sheet.get_tab("sheet1").get_region("roster")
+    assert list(roster.data["First"]) == ["Noor"]
+    assert len(api.requests) == 1
+    lab_grades = my_sheet.get_tab("sheet2").get_region("lab_grades")
+    assert list(lab_grades.data["Last"]) == ["Buchi"]
+    assert len(api.requests) == 1
+    # pickled regions keep their data but not the loader
+    temp_path = str(tmpdir.mkdir("temp"))
+    roster.region_to_pickle(temp_path)
+    extension = "pkl.zst" if sheet_collector.zstd else "pkl.gz"
+    out_data = sheet_collector.Region.from_pickle(
+        pathlib.Path(".") / temp_path / f"sheet1_roster.{extension}"
+    )
+    assert out_data.data.equals(roster.data)
+
+
+def build_lazy_sheet(test_data, value_ranges):
+    """Create a lazy sheet with a roster and an empty_region region."""
+    sample_config = copy.deepcopy(test_data["collect_regions_test"]["sample_config"])
+    sample_config["sheets"] = [
+        {
+            "name": "sheet1",
+            "regions": [
+                {
+                    "name": "empty_region",
+                    "start": "A1",
+                    "end": "C2",
+                    "contains_headers": True,
+                },
+                {
+                    "name": "roster",
+                    "start": "D1",
+                    "end": "F2",
+                    "contains_headers": True,
+                },
+            ],
+        }
+    ]
+    api = FakeSheetsApi(value_ranges)
+    my_sheet = sheet_collector.Sheet(sample_config, api)
+    my_sheet.collect_regions(lazy=True)
+    return my_sheet
+
+
+def test_sheet_collect_regions_lazy_bad_region(test_data):
+    """Check that a region that can't be converted doesn't break the others."""
+    region_values = [["First", "Last", "Grade"], ["Noor", "Buchi", "94"]]
+    my_sheet = build_lazy_sheet(test_data, [{}, {"values": region_values}])
+    tab = my_sheet.get_tab("sheet1")
+    assert list(tab.get_region("roster").data["First"]) == ["Noor"]
+    for _ in range(2):
+        with pytest.raises(Exception, match="empty data"):
+            tab.get_region("empty_region").data  # pylint: disable=W0106
+    assert list(tab.get_region("roster").data["First"]) == ["Noor"]
+
+
+def test_sheet_collect_regions_lazy_missing_ranges(test_data):
+    """Check that a batch response missing ranges raises a clear error."""
+    region_values = [["First", "Last", "Grade"], ["Noor", "Buchi", "94"]]
+    my_sheet = build_lazy_sheet(test_data, [{"values": region_values}])
+    with pytest.raises(Exception, match="requested 2 ranges"):
+        my_sheet.get_tab("sheet1").get_region("roster").data  # pylint: disable=W0106
+
+
 @pytest.mark.webtest
 def test_sheet_execute_sheet_call_no_error():
     """Call a test google sheet and assert that the values are as expected.
@@ -375,6 +641,32 @@ def test_sheet_collector_authenticate_api_env():
     assert sheets
 
 
+def test_sheet_collector_build_service_uses_timeout():
+    """Check that requests of the shared service use a per thread http object with a timeout."""
+    credentials = google.auth.credentials.AnonymousCredentials()
+    service = sheet_collector.SheetCollector.build_service(credentials)
+    sheets = service.spreadsheets()  # pylint: disable=E1101
+    first_request = sheets.values().batchGet(
+        spreadsheetId="file_id", ranges=["sheet1!A1:B2"]
+    )
+    second_request = sheets.values().batchGet(
+        spreadsheetId="file_id", ranges=["sheet1!A1:B2"]
+    )
+    assert first_request.http is second_request.http
+    assert first_request.http.credentials is credentials
+    assert first_request.http.http.timeout == 60
+    assert 308 not in first_request.http.http.redirect_codes
+    other_thread_requests = []
+    worker = threading.Thread(
+        target=lambda: other_thread_requests.append(
+            sheets.values().get(spreadsheetId="file_id", range="A1")
+        )
+    )
+    worker.start()
+    worker.join()
+    assert other_thread_requests[0].http is not first_request.http
+
+
 @pytest.mark.webtest
 def test_sheet_collector_authenticate_api_throws_error():
     """Check that an error is thrown when a file other than .env and .json is
@@ -421,6 +713,237 @@ def test_sheet_collector_collect_files_prints_output(tmpdir, test_data):
         assert sheet_key in my_collector.sheets_data
 
 
+@pytest.mark.usefixtures("mock_authentication")
+def test_sheet_collector_collect_files_no_config(tmp_path):
+    """Check that collect_files() throws an error when no config files exist."""
+    my_collector = sheet_collector.SheetCollector(sources_dir=str(tmp_path))
+    my_collector.sheets = FakeSheetsApi([])
+    with pytest.raises(Exception):
+        my_collector.collect_files()
+    assert not my_collector.sheets_data
+
+
+@pytest.mark.usefixtures("mock_authentication")
+def test_sheet_collector_collect_files_missing_directory(tmp_path):
+    """Check that collect_files() reports missing config files for a missing directory."""
+    my_collector = sheet_collector.SheetCollector(sources_dir=str(tmp_path / "missing"))
+    my_collector.sheets = FakeSheetsApi([])
+    with pytest.raises(Exception, match="No configuration files found"):
+        my_collector.collect_files()
+
+
+@pytest.mark.usefixtures("mock_authentication")
+def test_sheet_collector_collect_files_with_mocked_api(tmp_path, test_data):
+    """Check that collect_files() stores a Sheet for every config file."""
+    for file_name, config_val in test_data["collect_files_test"]["temp_files"].items():
+        with open(tmp_path / file_name, "w+", encoding="utf-8") as outfile:
+            yaml.dump(config_val, outfile)
+    my_collector = sheet_collector.SheetCollector(sources_dir=str(tmp_path))
+    region_values = [["First", "Last", "Grade"], ["Noor", "Buchi", "94"]]
+    my_collector.sheets = FakeSheetsApi([{"values": region_values}] * 4)
+    my_collector.collect_files(lazy=True)
+    assert list(my_collector.sheets_data) == sorted(
+        test_data["collect_files_test"]["expected_keys"]
+    )
+
+
+def build_dump_collector(test_data):
+    """Create a collector holding one sheet with two regions."""
+    my_collector = sheet_collector.SheetCollector()
+    my_sheet = sheet_collector.Sheet(
+        test_data["sheets_schema_test"]["passing"][0], None
+    )
+    my_dataframe = pd.DataFrame({"name": ["Noor"], "grade": ["94"]})
+    regions_dict = {
+        "lab1": sheet_collector.Region("lab1", "sheet1", "A1", "B2", my_dataframe),
+        "lab2": sheet_collector.Region("lab2", "sheet1", "C1", "D2", my_dataframe),
+    }
+    my_sheet.tabs = {"sheet1": sheet_collector.Tab("sheet1", regions_dict)}
+    my_collector.sheets_data = {"sample": my_sheet}
+    return my_collector
+
+
+@pytest.mark.usefixtures("mock_authentication")
+def test_sheet_collector_dump_all(tmp_path, test_data):
+    """Check that dump_all writes every region in every requested format."""
+    my_collector = build_dump_collector(test_data)
+    output_directory = tmp_path / "output"
+    my_collector.dump_all(output_directory)
+    assert sorted(path.name for path in (output_directory / "sample").iterdir()) == [
+        "sheet1_lab1.json",
+        "sheet1_lab2.json",
+    ]
+    with pytest.raises(Exception):
+        my_collector.dump_all(output_directory, formats=("csv",))
+
+
+@pytest.mark.usefixtures("mock_authentication")
+def test_sheet_collector_dump_all_same_region_names(tmp_path, test_data):
+    """Check that sources with the same tab and region names keep their files."""
+    my_collector = build_dump_collector(test_data)
+    other_collector = build_dump_collector(test_data)
+    other_sheet = other_collector.sheets_data["sample"]
+    other_sheet.get_tab("sheet1").get_region("lab1").data = pd.DataFrame(
+        {"name": ["Thomas"], "grade": ["96"]}
+    )
+    my_collector.sheets_data["other"] = other_sheet
+    output_directory = tmp_path / "output"
+    my_collector.dump_all(output_directory)
+    assert sorted(path.name for path in output_directory.iterdir()) == [
+        "other",
+        "sample",
+    ]
+    with open(output_directory / "other" / "sheet1_lab1.json", encoding="utf-8") as f:
+        assert "Thomas" in f.read()
+    with open(output_directory / "sample" / "sheet1_lab1.json", encoding="utf-8") as f:
+        assert "Noor" in f.read()
+
+
+@pytest.mark.usefixtures("mock_authentication")
+def test_sheet_collector_dump_all_colliding_full_names(tmp_path, test_data):
+    """Check that regions of one sheet writing the same file raise an error."""
+    my_collector = build_dump_collector(test_data)
+    my_sheet = my_collector.sheets_data["sample"]
+    my_dataframe = pd.DataFrame({"name": ["Noor"]})
+    my_sheet.tabs = {
+        "a": sheet_collector.Tab(
+            "a", {"b_c": sheet_collector.Region("b_c", "a", "A1", "A2", my_dataframe)}
+        ),
+        "a_b": sheet_collector.Tab(
+            "a_b", {"c": sheet_collector.Region("c", "a_b", "A1", "A2", my_dataframe)}
+        ),
+    }
+    output_directory = tmp_path / "output"
+    with pytest.raises(Exception, match="a_b_c"):
+        my_collector.dump_all(output_directory)
+    assert not output_directory.exists()
+
+
+@pytest.mark.usefixtures("mock_authentication")
+def test_sheet_collector_dump_all_parquet(tmp_path, test_data):
+    """Check that dump_all writes parquet files next to the other formats."""
+    pytest.importorskip("pyarrow")
+    my_collector = build_dump_collector(test_data)
+    output_directory = tmp_path / "output"
+    my_collector.dump_all(output_directory, formats=("parquet", "json"))
+    assert sorted(path.name for path in (output_directory / "sample").iterdir()) == [
+        "sheet1_lab1.json",
+        "sheet1_lab1.meta.json",
+        "sheet1_lab1.parquet",
+        "sheet1_lab2.json",
+        "sheet1_lab2.meta.json",
+        "sheet1_lab2.parquet",
+    ]
+
+
+@pytest.mark.usefixtures("mock_authentication")
+def test_sheet_collector_dump_all_parquet_without_pyarrow(
+    tmp_path, test_data, monkeypatch
+):
+    """Check that dump_all rejects parquet before writing when pyarrow is missing."""
+    my_collector = build_dump_collector(test_data)
+    find_spec = sheet_collector.importlib.util.find_spec
+    monkeypatch.setattr(
+        sheet_collector.importlib.util,
+        "find_spec",
+        lambda name: None if name == "pyarrow" else find_spec(name),
+    )
+    output_directory = tmp_path / "output"
+    with pytest.raises(Exception, match="pyarrow"):
+        my_collector.dump_all(output_directory, formats=("json", "parquet"))
+    assert not output_directory.exists()
+
+
+@pytest.mark.parametrize("sources_dir", [".", "./"])
+@pytest.mark.usefixtures("mock_authentication")
+def test_sheet_collector_collect_files_current_directory(
+    tmp_path, test_data, monkeypatch, sources_dir
+):
+    """Check that collect_files() reads the config files of the current directory."""
+    monkeypatch.chdir(tmp_path)
+    for file_name, config_val in test_data["collect_files_test"]["temp_files"].items():
+        with open(tmp_path / file_name, "w+", encoding="utf-8") as outfile:
+            yaml.dump(config_val, outfile)
+    my_collector = sheet_collector.SheetCollector(sources_dir=sources_dir)
+    region_values = [["First", "Last", "Grade"], ["Noor", "Buchi", "94"]]
+    my_collector.sheets = FakeSheetsApi([{"values": region_values}] * 4)
+    my_collector.collect_files(lazy=True)
+    assert list(my_collector.sheets_data) == sorted(
+        test_data["collect_files_test"]["expected_keys"]
+    )
+
+
+def test_get_bundle_path_unnamed_directories(tmp_path, monkeypatch):
+    """Check that directories without a name still get a bundle path."""
+    monkeypatch.chdir(tmp_path)
+    expected_path = tmp_path.parent / f"{tmp_path.name}.bundle.yaml"
+    assert sheet_collector.get_bundle_path(".") == expected_path
+    assert sheet_collector.get_bundle_path("./") == expected_path
+    assert sheet_collector.get_bundle_path("/") == pathlib.Path("/.bundle.yaml")
+
+
+@pytest.mark.usefixtures("mock_authentication")
+def test_write_bundle_used_by_collector(tmp_path, test_data):
+    """Check that collector configurations are read from a bundle once written."""
+    sources_dir = tmp_path / "sheet_sources"
+    sources_dir.mkdir()
+    for file_name, config_val in test_data["collect_files_test"]["temp_files"].items():
+        with open(sources_dir / file_name, "w+", encoding="utf-8") as outfile:
+            yaml.dump(config_val, outfile)
+    bundle_path = sheet_collector.write_bundle(sources_dir)
+    assert bundle_path == tmp_path / "sheet_sources.bundle.yaml"
+    # remove the individual files to check that only the bundle is read
+    for yaml_file in util.get_yaml_files(sources_dir):
+        yaml_file.unlink()
+    os.utime(bundle_path)
+    my_collector = sheet_collector.SheetCollector(sources_dir=str(sources_dir))
+    # pylint: disable=W0212
+    configs = dict(my_collector._load_configs())
+    assert sorted(configs) == sorted(test_data["collect_files_test"]["expected_keys"])
+
+
+@pytest.mark.usefixtures("mock_authentication")
+def test_write_bundle_ignored_after_file_edit(tmp_path, test_data):
+    """Check that a yaml file edited after the bundle is read instead of it."""
+    sources_dir = tmp_path / "sheet_sources"
+    sources_dir.mkdir()
+    for file_name, config_val in test_data["collect_files_test"]["temp_files"].items():
+        with open(sources_dir / file_name, "w+", encoding="utf-8") as outfile:
+            yaml.dump(config_val, outfile)
+    bundle_path = sheet_collector.write_bundle(sources_dir)
+    edited_file = util.get_yaml_files(sources_dir)[0]
+    edited_config = yaml.safe_load(edited_file.read_text(encoding="utf-8"))
+    edited_config["source_id"] = "edited_source"
+    with open(edited_file, "w", encoding="utf-8") as outfile:
+        yaml.dump(edited_config, outfile)
+    bundle_mtime = bundle_path.stat().st_mtime_ns
+    os.utime(edited_file, ns=(bundle_mtime + 10**9, bundle_mtime + 10**9))
+    os.utime(sources_dir, ns=(bundle_mtime, bundle_mtime))
+    my_collector = sheet_collector.SheetCollector(sources_dir=str(sources_dir))
+    # pylint: disable=W0212
+    configs = dict(my_collector._load_configs())
+    assert configs[edited_file.stem]["source_id"] == "edited_source"
+
+
+# pylint: disable=W0212
+def test_load_yaml_cached_returns_copy(tmp_path):
+    """Check that cached yaml configs can be mutated without affecting the cache."""
+    yaml_file = tmp_path / "config.yaml"
+    yaml_file.write_text("source_id: abc\n", encoding="utf-8")
+    first_load = sheet_collector._load_yaml_cached(yaml_file)
+    first_load["source_id"] = "changed"
+    assert sheet_collector._load_yaml_cached(yaml_file) == {"source_id": "abc"}
+
+
+def test_load_yaml_cached_detects_changes(tmp_path):
+    """Check that a modified yaml file is parsed again."""
+    yaml_file = tmp_path / "config.yaml"
+    yaml_file.write_text("source_id: abc\n", encoding="utf-8")
+    assert sheet_collector._load_yaml_cached(yaml_file) == {"source_id": "abc"}
+    yaml_file.write_text("source_id: abcdef\n", encoding="utf-8")
+    assert sheet_collector._load_yaml_cached(yaml_file) == {"source_id": "abcdef"}
+
+
 def test_extract_sheet_id_returns_expected_id():
     """Test that function returns correct ID from full URL."""
     expected_id = "1XKnoa1BBzEnJ1TA_LTRs5e0zcva0SCgNyt7cfMVGHWc"
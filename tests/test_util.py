@@ -3,6 +3,36 @@
 from sheetshuttle import util
 
 
+def test_get_yaml_files_finds_yaml_and_yml(tmp_path):
+    """Check that only .yaml and .yml files are returned."""
+    for file_name in ("first.yaml", "second.yml", "notes.txt"):
+        (tmp_path / file_name).touch()
+    (tmp_path / "folder.yaml").mkdir()
+    yaml_files = util.get_yaml_files(tmp_path)
+    assert [path.name for path in yaml_files] == ["first.yaml", "second.yml"]
+
+
+def test_get_yaml_files_exists(tmp_path):
+    """Check that yaml files are returned sorted by name."""
+    for file_name in ("file3.yaml", "file1.yaml", "file2.yml"):
+        (tmp_path / file_name).touch()
+    assert [path.name for path in util.get_yaml_files(tmp_path)] == [
+        "file1.yaml",
+        "file2.yml",
+        "file3.yaml",
+    ]
+
+
+def test_get_yaml_files_empty(tmp_path):
+    """Check that an empty list is returned when no yaml files exist."""
+    assert util.get_yaml_files(tmp_path) == []
+
+
+def test_get_yaml_files_missing_directory(tmp_path):
+    """Check that an empty list is returned when the directory doesn't exist."""
+    assert util.get_yaml_files(tmp_path / "missing") == []
+
+
 def test_fill_to_dimensions_appends_none_to_empty_strings():
     """Check that blank cells are type None."""
     # input data with empty strings as empty cells